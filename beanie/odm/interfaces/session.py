@@ -1,14 +1,18 @@
-from typing import Optional
+from typing import Optional, TypeVar
 
 from pymongo.client_session import ClientSession
 
+SessionMethodsType = TypeVar("SessionMethodsType", bound="SessionMethods")
+
 
 class SessionMethods:
     """
     Session methods
     """
 
-    def set_session(self, session: Optional[ClientSession] = None):
+    def set_session(
+        self: SessionMethodsType, session: Optional[ClientSession] = None
+    ) -> SessionMethodsType:
         """
         Set pymongo session
         :param session: Optional[ClientSession] - pymongo session
@@ -47,5 +47,6 @@ class BaseCursorQuery:
         )
         projection = self.get_projection_model()
         if projection is not None:
-            return [projection.parse_obj(i) for i in motor_list]
+            parse_obj = projection.parse_obj
+            return [parse_obj(i) for i in motor_list]
         return motor_list
@@ -5,6 +5,7 @@ from typing import (
     Tuple,
     Type,
     Mapping,
+    Sequence,
     TYPE_CHECKING,
     TypeVar,
     Dict,
@@ -23,11 +24,11 @@ from beanie.odm.interfaces.session import SessionMethods
 from beanie.odm.interfaces.update import (
     UpdateMethods,
 )
+from beanie.odm.operators import BaseOperator
 from beanie.odm.operators.find.logical import And
 from beanie.odm.queries.aggregation import AggregationQuery
 from beanie.odm.queries.cursor import BaseCursorQuery
 from beanie.odm.queries.delete import (
-    DeleteQuery,
     DeleteMany,
     DeleteOne,
 )
@@ -43,6 +44,29 @@ if TYPE_CHECKING:
 
 FindQueryType = TypeVar("FindQueryType", bound="FindQuery")
 
+SORT_PREFIXES: Dict[str, SortDirection] = {
+    "+": SortDirection.ASCENDING,
+    "-": SortDirection.DESCENDING,
+}
+
+
+def render_query(query: Any) -> Any:
+    """
+    Replace operators with the queries they produce, recursively.
+    Operators build their query on every access, so a rendered filter
+    can be reused without rebuilding it for each encoding.
+
+    :param query: Any - operator, dict, list or plain value
+    :return: Any
+    """
+    if isinstance(query, BaseOperator):
+        return render_query(query.query)
+    if isinstance(query, dict):
+        return {key: render_query(value) for key, value in query.items()}
+    if isinstance(query, list):
+        return [render_query(item) for item in query]
+    return query
+
 
 class FindQuery(UpdateMethods, SessionMethods):
     """
@@ -57,21 +81,52 @@ class FindQuery(UpdateMethods, SessionMethods):
     UpdateQueryType: Union[
         Type[UpdateQuery], Type[UpdateMany], Type[UpdateOne]
     ] = UpdateQuery
-    DeleteQueryType: Union[
-        Type[DeleteOne], Type[DeleteMany], Type[DeleteQuery]
-    ] = DeleteQuery
+    DeleteQueryType: Union[Type[DeleteOne], Type[DeleteMany]]
 
     def __init__(self, document_model: Type["DocType"]):
         self.document_model: Type["DocType"] = document_model
         self.find_expressions: List[Mapping[str, Any]] = []
         self.projection_model: Type[BaseModel] = self.document_model
         self.session = None
+        self._filter_cache: Optional[Mapping[str, Any]] = None
+        self._params_cache: Optional[Dict[str, Any]] = None
+
+    def _add_find_expressions(
+        self, expressions: Sequence[Mapping[str, Any]]
+    ) -> None:
+        """
+        Add search criteria. Non-empty And operators are unpacked, so
+        chained criteria end up in a single flat `$and` list.
+
+        :param expressions: Sequence[Mapping[str, Any]] - search criteria
+        :return: None
+        """
+        if not expressions:
+            return
+        for expression in expressions:
+            if isinstance(expression, And) and expression.expressions:
+                self._add_find_expressions(expression.expressions)
+            else:
+                self.find_expressions.append(expression)
+        self._filter_cache = None
+        self._params_cache = None
 
     def get_filter_query(self) -> Mapping[str, Any]:
-        if self.find_expressions:
-            return And(*self.find_expressions)
-        else:
-            return {}
+        """
+        Filter of the query with all the operators rendered to plain
+        dicts. It is built once and reused until new search criteria
+        are added.
+
+        :return: Mapping[str, Any]
+        """
+        if self._filter_cache is None:
+            if len(self.find_expressions) > 1:
+                self._filter_cache = render_query(And(*self.find_expressions))
+            elif self.find_expressions:
+                self._filter_cache = render_query(self.find_expressions[0])
+            else:
+                self._filter_cache = {}
+        return self._filter_cache
 
     def update(
         self, *args: Mapping[str, Any], session: Optional[ClientSession] = None
@@ -147,11 +202,30 @@ class FindQuery(UpdateMethods, SessionMethods):
         """
         if projection_model is not None:
             self.projection_model = projection_model
+            self._params_cache = None
         return self
 
     def get_projection_model(self) -> Type[BaseModel]:
         return self.projection_model
 
+    def _build_find_query_params(self) -> Dict[str, Any]:
+        return {
+            "filter": self.get_filter_query(),
+            "projection": get_projection(self.projection_model),
+        }
+
+    def _find_query_params(self) -> Dict[str, Any]:
+        """
+        Keyword arguments for the motor find call, except the session.
+        They are built once and reused until one of the query setters
+        changes the query.
+
+        :return: Dict[str, Any]
+        """
+        if self._params_cache is None:
+            self._params_cache = self._build_find_query_params()
+        return self._params_cache
+
 
 class FindMany(FindQuery, BaseCursorQuery, AggregateMethods):
     """
@@ -196,7 +270,7 @@ class FindMany(FindQuery, BaseCursorQuery, AggregateMethods):
         :param session: Optional[ClientSession] - pymongo session
         :return: FindMany - query instance
         """
-        self.find_expressions += args
+        self._add_find_expressions(args)
         self.skip(skip)
         self.limit(limit)
         self.sort(sort)
@@ -241,6 +315,7 @@ class FindMany(FindQuery, BaseCursorQuery, AggregateMethods):
         the sort order for this query.
         :return: self
         """
+        self._params_cache = None
         for arg in args:
             if arg is None:
                 pass
@@ -249,18 +324,13 @@ class FindMany(FindQuery, BaseCursorQuery, AggregateMethods):
             elif isinstance(arg, tuple):
                 self.sort_expressions.append(arg)
             elif isinstance(arg, str):
-                if arg.startswith("+"):
-                    self.sort_expressions.append(
-                        (arg[1:], SortDirection.ASCENDING)
-                    )
-                elif arg.startswith("-"):
-                    self.sort_expressions.append(
-                        (arg[1:], SortDirection.DESCENDING)
-                    )
-                else:
+                direction = SORT_PREFIXES.get(arg[:1])
+                if direction is None:
                     self.sort_expressions.append(
                         (arg, SortDirection.ASCENDING)
                     )
+                else:
+                    self.sort_expressions.append((arg[1:], direction))
             else:
                 raise TypeError("Wrong argument type")
         return self
@@ -273,6 +343,7 @@ class FindMany(FindQuery, BaseCursorQuery, AggregateMethods):
         """
         if n is not None:
             self.skip_number = n
+            self._params_cache = None
         return self
 
     def limit(self, n: Optional[int]) -> "FindMany":
@@ -283,6 +354,7 @@ class FindMany(FindQuery, BaseCursorQuery, AggregateMethods):
         """
         if n is not None:
             self.limit_number = n
+            self._params_cache = None
         return self
 
     def update_many(
@@ -346,15 +418,19 @@ class FindMany(FindQuery, BaseCursorQuery, AggregateMethods):
             find_query=self.get_filter_query(),
         ).set_session(session=self.session)
 
-    @property
-    def motor_cursor(self):
-        return self.document_model.get_motor_collection().find(
-            filter=self.get_filter_query(),
+    def _build_find_query_params(self) -> Dict[str, Any]:
+        params = super(FindMany, self)._build_find_query_params()
+        params.update(
             sort=self.sort_expressions,
-            projection=get_projection(self.projection_model),
             skip=self.skip_number,
             limit=self.limit_number,
-            session=self.session,
+        )
+        return params
+
+    @property
+    def motor_cursor(self):
+        return self.document_model.get_motor_collection().find(
+            **self._find_query_params(), session=self.session
         )
 
 
@@ -384,7 +460,7 @@ class FindOne(FindQuery):
         :param session: Optional[ClientSession] - pymongo session
         :return: FindOne - query instance
         """
-        self.find_expressions += args
+        self._add_find_expressions(args)
         self.project(projection_model)
         self.set_session(session=session)
         return self
@@ -441,12 +517,9 @@ class FindOne(FindQuery):
         Run the query
         :return: BaseModel
         """
-        projection = get_projection(self.projection_model)
         document: Dict[str, Any] = (
             yield from self.document_model.get_motor_collection().find_one(
-                filter=self.get_filter_query(),
-                projection=projection,
-                session=self.session,
+                **self._find_query_params(), session=self.session
             )
         )
         if document is None:
@@ -1,11 +1,33 @@
 from typing import Dict, Type, TypeVar
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 
 ProjectionModelType = TypeVar("ProjectionModelType", bound=BaseModel)
 
+_projection_cache: "WeakKeyDictionary[type, Dict[str, int]]" = (
+    WeakKeyDictionary()
+)
+
 
 def get_projection(model: Type[ProjectionModelType]) -> Dict[str, int]:
+    """
+    Projection of the model. It is a pure function of the model class,
+    so it is computed once per class and the same dict is returned
+    afterwards - callers must not modify it. The cache holds the classes
+    weakly, so models created at runtime can still be collected.
+
+    :param model: Type[BaseModel] - projection model
+    :return: Dict[str, int]
+    """
+    projection = _projection_cache.get(model)
+    if projection is None:
+        projection = _build_projection(model)
+        _projection_cache[model] = projection
+    return projection
+
+
+def _build_projection(model: Type[ProjectionModelType]) -> Dict[str, int]:
     if hasattr(model, "Settings"):  # MyPy checks
         settings = getattr(model, "Settings")
         if hasattr(settings, "projection"):
@@ -2,6 +2,8 @@ import pytest
 from pydantic import BaseModel
 
 from beanie.odm.enums import SortDirection
+from beanie.odm.operators.find.logical import And
+from beanie.odm.utils.projection import get_projection
 from tests.odm.models import Sample
 
 
@@ -21,10 +23,54 @@ async def test_find_query():
     )
     assert q == {"$and": [{"integer": 1}, {"nested.integer": {"$gte": 2}}]}
 
+    q = (
+        Sample.find_many(And(Sample.integer == 1, Sample.nested.integer >= 2))
+        .find_many(Sample.string == "test")
+        .get_filter_query()
+    )
+    assert q == {
+        "$and": [
+            {"integer": 1},
+            {"nested.integer": {"$gte": 2}},
+            {"string": "test"},
+        ]
+    }
+
     q = Sample.find().get_filter_query()
     assert q == {}
 
 
+async def test_find_query_filter_cache():
+    q = Sample.find_many(Sample.integer > 1)
+    filter_query = q.get_filter_query()
+    assert type(filter_query) is dict
+    assert q.get_filter_query() is filter_query
+
+    q.find_many(skip=1)
+    assert q.get_filter_query() is filter_query
+
+    q.find_many(Sample.integer < 100)
+    assert type(q.get_filter_query()) is dict
+    assert q.get_filter_query() == {
+        "$and": [{"integer": {"$gt": 1}}, {"integer": {"$lt": 100}}]
+    }
+
+
+async def test_find_query_params_cache():
+    q = Sample.find_many(Sample.integer > 1)
+    params = q._find_query_params()
+    assert q._find_query_params() is params
+
+    q.find_many(Sample.integer < 100).sort("-integer").skip(1).limit(2)
+    params = q._find_query_params()
+    assert params["filter"] == {
+        "$and": [{"integer": {"$gt": 1}}, {"integer": {"$lt": 100}}]
+    }
+    assert params["sort"] == [("integer", SortDirection.DESCENDING)]
+    assert params["skip"] == 1
+    assert params["limit"] == 2
+
+
 async def test_find_many(preset_documents):
     result = (
         await Sample.find_many(Sample.integer > 1)
@@ -258,6 +304,16 @@ async def test_find_many_with_custom_projection(preset_documents):
     ]
 
 
+async def test_projection_is_cached():
+    class SampleProjection(BaseModel):
+        string: str
+        integer: int
+
+    projection = get_projection(SampleProjection)
+    assert projection == {"string": 1, "integer": 1}
+    assert get_projection(SampleProjection) is projection
+
+
 async def test_find_many_with_session(preset_documents, session):
     q_1 = (
         Sample.find_many(Sample.integer > 1)